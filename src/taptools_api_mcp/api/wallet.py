@@ -3,7 +3,8 @@ WalletAPI for wallet-related endpoints.
 """
 import logging
 import httpx
-from typing import Dict, Any, List
+from typing import Any, Callable, List
+from pydantic import TypeAdapter, ValidationError
 
 from ..models.wallet import (
     WalletPortfolioPositionsRequest, WalletPortfolioPositionsResponse,
@@ -14,29 +15,34 @@ from ..utils.exceptions import TapToolsError, ErrorType
 
 logger = logging.getLogger("taptools_mcp")
 
+# Validators for list responses, built once so they parse JSON bytes directly
+_TOKEN_TRADES_ADAPTER = TypeAdapter(List[WalletTokenTrade])
+_VALUE_TRENDS_ADAPTER = TypeAdapter(List[WalletValueTrend])
+
 class WalletAPI:
     def __init__(self, client: httpx.AsyncClient):
         self.client = client
 
-    async def _make_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+    async def _make_request(self, method: str, url: str, parse: Callable[[bytes], Any], **kwargs) -> Any:
         """
         Make an HTTP request with error handling.
         
         Args:
             method: HTTP method (get, post, etc.)
             url: API endpoint URL
+            parse: Validator applied to the raw JSON body of the response
             **kwargs: Additional arguments for the request
             
         Returns:
-            API response as dictionary
+            API response as validated by parse
             
         Raises:
-            TapToolsError: For any API or connection errors
+            TapToolsError: For any API, connection or response parsing errors
         """
         try:
             response = await getattr(self.client, method)(url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return parse(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error in request to {url}: {str(e)}")
             raise TapToolsError.from_http_error(e)
@@ -46,6 +52,12 @@ class WalletAPI:
                 message=f"Connection error: {str(e)}",
                 error_type=ErrorType.CONNECTION
             )
+        except ValidationError as e:
+            logger.error(f"Invalid response from {url}: {str(e)}")
+            raise TapToolsError(
+                message=f"Failed to parse response: {str(e)}",
+                error_type=ErrorType.PARSE
+            )
         except Exception as e:
             logger.error(f"Unexpected error in request to {url}: {str(e)}")
             raise TapToolsError(
@@ -64,8 +76,9 @@ class WalletAPI:
         """
         url = "/wallet/portfolio/positions"
         params = request.model_dump(exclude_none=True)
-        response_data = await self._make_request("get", url, params=params)
-        return WalletPortfolioPositionsResponse(**response_data)
+        return await self._make_request(
+            "get", url, WalletPortfolioPositionsResponse.model_validate_json, params=params
+        )
 
     async def get_wallet_trades_tokens(
         self,
@@ -78,8 +91,9 @@ class WalletAPI:
         """
         url = "/wallet/trades/tokens"
         params = request.model_dump(exclude_none=True)
-        response_data = await self._make_request("get", url, params=params)
-        return [WalletTokenTrade(**trade) for trade in response_data]
+        return await self._make_request(
+            "get", url, _TOKEN_TRADES_ADAPTER.validate_json, params=params
+        )
 
     async def get_wallet_value_trended(
         self,
@@ -92,5 +106,6 @@ class WalletAPI:
         """
         url = "/wallet/value/trended"
         params = request.model_dump(exclude_none=True)
-        response_data = await self._make_request("get", url, params=params)
-        return [WalletValueTrend(**trend) for trend in response_data]
+        return await self._make_request(
+            "get", url, _VALUE_TRENDS_ADAPTER.validate_json, params=params
+        )
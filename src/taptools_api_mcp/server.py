@@ -1,7 +1,7 @@
 import os
 import json
 import logging
-from typing import Optional
+from typing import IO, Optional
 from contextlib import asynccontextmanager
 
 import httpx
@@ -108,8 +108,14 @@ class ServerConfig(BaseModel):
     )
 
     @classmethod
-    def from_env(cls, env_file: str = ".env"):
-        if os.path.exists(env_file):
+    def from_env(cls, env_file: str = ".env", stream: Optional[IO[str]] = None):
+        """
+        Build a config from the environment, after loading env_file if it exists.
+        If stream is given, its .env-formatted contents are loaded instead of env_file.
+        """
+        if stream is not None:
+            load_dotenv(stream=stream)
+        elif os.path.exists(env_file):
             load_dotenv(env_file)
         api_key = os.getenv("TAPTOOLS_API_KEY", "").strip()
         if not api_key:
@@ -2,20 +2,52 @@
 Shared test fixtures for TapTools MCP tests.
 """
 import pytest
-import pytest_asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import create_autospec
 import httpx
 
-from taptools_api_mcp.server import ServerConfig
+from taptools_api_mcp.server import TapToolsServer, ServerConfig
 
-@pytest_asyncio.fixture
-async def mock_client():
+# Request attached to the HTTPStatusErrors raised by mock responses
+_STUB_REQUEST = httpx.Request("GET", "http://test")
+
+@pytest.fixture(scope="session")
+def _mock_client_template():
     """
-    Creates a mocked httpx.AsyncClient for testing API calls.
+    Builds the autospecced httpx.AsyncClient mock once per session.
     """
-    client = AsyncMock(spec=httpx.AsyncClient)
-    client.is_closed = False
-    return client
+    return create_autospec(httpx.AsyncClient, instance=True, spec_set=True)
+
+@pytest.fixture
+def mock_client(_mock_client_template):
+    """
+    Returns the shared mocked httpx.AsyncClient, reset for this test.
+    """
+    _mock_client_template.reset_mock(return_value=True, side_effect=True)
+    _mock_client_template.is_closed = False
+    return _mock_client_template
+
+class _FakeResponse:
+    """
+    Minimal stand-in for httpx.Response with a fixed status code and JSON body.
+    """
+    __slots__ = ("status_code", "headers", "text", "_json_data")
+
+    def __init__(self, status_code, json_data, headers):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = ""
+        self._json_data = json_data
+
+    def json(self):
+        return self._json_data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise httpx.HTTPStatusError(
+                f"HTTP {self.status_code}",
+                request=_STUB_REQUEST,
+                response=self
+            )
 
 @pytest.fixture
 def mock_response():
@@ -23,43 +55,36 @@ def mock_response():
     Factory fixture to create mock HTTP responses with custom status codes and data.
     """
     def _mock_response(status_code=200, json_data=None, headers=None):
-        response = MagicMock(spec=httpx.Response)
-        response.status_code = status_code
-        response.json.return_value = json_data or {}
-        response.headers = headers or {}
-        
-        if status_code >= 400:
-            def raise_for_status():
-                raise httpx.HTTPStatusError(
-                    f"HTTP {status_code}",
-                    request=MagicMock(spec=httpx.Request),
-                    response=response
-                )
-            response.raise_for_status.side_effect = raise_for_status
-        else:
-            response.raise_for_status.return_value = None
-            
-        return response
+        return _FakeResponse(status_code, json_data or {}, headers or {})
     return _mock_response
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     """
-    Creates a test ServerConfig instance.
+    Creates a test ServerConfig instance shared by the whole session.
     """
     return ServerConfig(TAPTOOLS_API_KEY="test-api-key")
 
+@pytest.fixture(scope="module")
+def server(config):
+    """
+    Creates a TapToolsServer shared by a test module. The server holds no
+    HTTP client; its tools read one from the app's lifespan context.
+    """
+    return TapToolsServer(config)
+
 @pytest.fixture
 def sample_token_data():
     """
     Sample token data for testing responses.
     """
     return {
-        "unit": "test_token",
-        "mcap": 1000000,
-        "price": 1.23,
-        "supply": 1000000,
-        "holders": 500
+        "circSupply": 1000000.0,
+        "fdv": 2000000.0,
+        "mcap": 1500000.0,
+        "price": 1.5,
+        "ticker": "TEST",
+        "totalSupply": 2000000.0
     }
 
 @pytest.fixture
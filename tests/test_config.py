@@ -0,0 +1,35 @@
+"""
+Tests for the TapTools MCP server configuration.
+"""
+import io
+import pytest
+from taptools_api_mcp.server import ServerConfig
+
+class TestServerConfig:
+    def test_from_env_success(self, monkeypatch):
+        """Test successful config creation from environment variables."""
+        monkeypatch.setenv("TAPTOOLS_API_KEY", "test-api-key")
+        config = ServerConfig.from_env()
+        assert config.api_key == "test-api-key"
+
+    def test_from_env_missing_key(self, monkeypatch):
+        """Test error handling when API key is missing."""
+        monkeypatch.delenv("TAPTOOLS_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="TAPTOOLS_API_KEY not found"):
+            ServerConfig.from_env()
+
+    def test_from_env_empty_key(self, monkeypatch):
+        """Test error handling when API key is empty."""
+        monkeypatch.setenv("TAPTOOLS_API_KEY", "  ")
+        with pytest.raises(ValueError, match="TAPTOOLS_API_KEY not found"):
+            ServerConfig.from_env()
+
+    def test_from_env_with_stream(self, monkeypatch):
+        """Test loading config from .env contents in a stream."""
+        # load_dotenv writes to os.environ; setenv first so teardown removes the key
+        monkeypatch.setenv("TAPTOOLS_API_KEY", "")
+        monkeypatch.delenv("TAPTOOLS_API_KEY")
+        stream = io.StringIO("TAPTOOLS_API_KEY=test-api-key-from-stream")
+
+        config = ServerConfig.from_env(stream=stream)
+        assert config.api_key == "test-api-key-from-stream"
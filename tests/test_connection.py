@@ -4,6 +4,9 @@ import pytest
 from mcp.client.session import ClientSession
 from mcp.shared.exceptions import McpError
 
+# These tests launch the server and hit the real API; run them with `pytest -m live`
+pytestmark = pytest.mark.live
+
 @pytest.mark.asyncio
 class TestTapToolsConnection:
     """Test suite for TapTools MCP server connection."""
@@ -109,7 +109,7 @@ def sample_policy_data():
         "totalAssets": 2
     }
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestIntegrationAPI:
     async def test_get_asset_success(self, mock_client, mock_response, sample_asset_data):
         """Test successful asset retrieval."""
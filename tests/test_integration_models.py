@@ -24,8 +24,9 @@ class TestIntegrationAssetModels:
         """Test IntegrationAssetRequest fails without required id."""
         with pytest.raises(ValidationError) as exc:
             IntegrationAssetRequest()
-        assert "field required" in str(exc.value)
-        assert "id" in str(exc.value)
+        msg = str(exc.value)
+        assert "field required" in msg
+        assert "id" in msg
 
     def test_integration_asset_valid(self):
         """Test IntegrationAsset with valid data."""
@@ -111,8 +112,9 @@ class TestIntegrationPolicyAssetsModels:
         """Test IntegrationPolicyAssetsRequest fails without required id."""
         with pytest.raises(ValidationError) as exc:
             IntegrationPolicyAssetsRequest()
-        assert "field required" in str(exc.value)
-        assert "id" in str(exc.value)
+        msg = str(exc.value)
+        assert "field required" in msg
+        assert "id" in msg
 
     def test_policy_asset_valid(self):
         """Test PolicyAsset with valid data."""
@@ -173,9 +175,10 @@ class TestIntegrationPolicyAssetsModels:
                 description=123,  # Should be string if provided
                 total_assets="invalid"  # Should be integer
             )
-        assert "str type expected" in str(exc.value)
-        assert "value is not a valid integer" in str(exc.value)
-        assert "id" in str(exc.value)
+        msg = str(exc.value)
+        assert "str type expected" in msg
+        assert "value is not a valid integer" in msg
+        assert "id" in msg
 
 class TestIntegrationEventsModels:
     def test_integration_events_request_valid(self):
@@ -272,8 +275,9 @@ class TestIntegrationPairModels:
                 factory_address=123,  # Should be string
                 id=123  # Should be string
             )
-        assert "value is not a valid integer" in str(exc.value)
-        assert "str type expected" in str(exc.value)
+        msg = str(exc.value)
+        assert "value is not a valid integer" in msg
+        assert "str type expected" in msg
 
     def test_integration_pair_missing_required(self):
         """Test IntegrationPair fails without required fields."""
@@ -49,7 +49,7 @@ def sample_market_overview():
         ]
     }
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestMarketAPI:
     async def test_get_market_stats_success(self, mock_client, mock_response, sample_market_stats):
         """Test successful market stats retrieval."""
@@ -37,8 +37,9 @@ class TestMarketStatsModels:
                 active_addresses="invalid",  # Should be integer
                 dex_volume="invalid"  # Should be float
             )
-        assert "value is not a valid integer" in str(exc.value)
-        assert "value is not a valid float" in str(exc.value)
+        msg = str(exc.value)
+        assert "value is not a valid integer" in msg
+        assert "value is not a valid float" in msg
 
     def test_market_stats_missing_required(self):
         """Test MarketStats fails without required fields."""
@@ -147,8 +148,9 @@ class TestMarketOverviewModels:
                 change24h="invalid",  # Should be float
                 volume24h="invalid"  # Should be float
             )
-        assert "value is not a valid string" in str(exc.value)
-        assert "value is not a valid float" in str(exc.value)
+        msg = str(exc.value)
+        assert "value is not a valid string" in msg
+        assert "value is not a valid float" in msg
 
     def test_market_overview_token_missing_required(self):
         """Test MarketOverviewToken fails without required fields."""
@@ -96,7 +96,7 @@ def sample_collection_trades():
         }
     ]
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestNftsAPI:
     async def test_get_nft_asset_sales_success(self, mock_client, mock_response, sample_asset_sales_data):
         """Test successful get_nft_asset_sales."""
@@ -26,8 +26,9 @@ class TestNFTAssetSalesModels:
         """Test NFTAssetSalesRequest fails without required policy."""
         with pytest.raises(ValidationError) as exc:
             NFTAssetSalesRequest()
-        assert "field required" in str(exc.value)
-        assert "policy" in str(exc.value)
+        msg = str(exc.value)
+        assert "field required" in msg
+        assert "policy" in msg
 
     def test_nft_sale_valid(self):
         """Test NFTSale with valid data."""
@@ -90,8 +91,9 @@ class TestNFTCollectionStatsModels:
                 top_offer="invalid",
                 volume="invalid"
             )
-        assert "value is not a valid integer" in str(exc.value)
-        assert "value is not a valid float" in str(exc.value)
+        msg = str(exc.value)
+        assert "value is not a valid integer" in msg
+        assert "value is not a valid float" in msg
 
 class TestNFTCollectionTradesModels:
     def test_nft_collection_trades_request_defaults(self):
@@ -243,5 +245,6 @@ class TestNFTTopVolumeModels:
                 supply="invalid",
                 volume="invalid"
             )
-        assert "value is not a valid integer" in str(exc.value)
-        assert "value is not a valid float" in str(exc.value)
+        msg = str(exc.value)
+        assert "value is not a valid integer" in msg
+        assert "value is not a valid float" in msg
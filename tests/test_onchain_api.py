@@ -58,7 +58,7 @@ def sample_tx_utxos_data():
         ]
     }
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestOnchainAPI:
     async def test_get_asset_supply_success(self, mock_client, mock_response, sample_supply_data):
         """Test get_asset_supply success."""
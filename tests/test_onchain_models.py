@@ -21,8 +21,9 @@ class TestAssetSupplyModels:
         """Test AssetSupplyRequest fails without required unit."""
         with pytest.raises(ValidationError) as exc:
             AssetSupplyRequest()
-        assert "field required" in str(exc.value)
-        assert "unit" in str(exc.value)
+        msg = str(exc.value)
+        assert "field required" in msg
+        assert "unit" in msg
 
     def test_asset_supply_response_valid(self):
         """Test AssetSupplyResponse with valid data."""
@@ -121,8 +122,9 @@ class TestAddressUTXOsModels:
                 index="invalid",  # Should be integer
                 lovelace=1000000  # Should be string
             )
-        assert "value is not a valid list" in str(exc.value)
-        assert "value is not a valid integer" in str(exc.value)
+        msg = str(exc.value)
+        assert "value is not a valid list" in msg
+        assert "value is not a valid integer" in msg
 
 class TestTransactionUTXOsModels:
     def test_transaction_utxos_request_valid(self):
@@ -134,8 +136,9 @@ class TestTransactionUTXOsModels:
         """Test TransactionUTXOsRequest fails without required hash."""
         with pytest.raises(ValidationError) as exc:
             TransactionUTXOsRequest()
-        assert "field required" in str(exc.value)
-        assert "hash" in str(exc.value)
+        msg = str(exc.value)
+        assert "field required" in msg
+        assert "hash" in msg
 
     def test_transaction_utxos_response_valid(self):
         """Test TransactionUTXOsResponse with valid data."""
@@ -1,7 +1,7 @@
 """Tests for the WalletAPI class."""
 import pytest
+import pytest_asyncio
 import httpx
-from unittest.mock import AsyncMock, MagicMock
 
 from taptools_api_mcp.api.wallet import WalletAPI
 from taptools_api_mcp.utils.exceptions import TapToolsError, ErrorType
@@ -10,7 +10,24 @@ from taptools_api_mcp.models.wallet import (
     WalletValueTrendedRequest
 )
 
-@pytest.fixture
+# Wallet address requested throughout the tests
+_ADDRESS = "addr1xyz..."
+
+# Requests sent by the tests; the API only reads them, so they are shared
+_REQ_PORTFOLIO = WalletPortfolioPositionsRequest(address=_ADDRESS)
+_REQ_TRADES = WalletTokenTradesRequest(address=_ADDRESS)
+_REQ_VALUE_TRENDED = WalletValueTrendedRequest(address=_ADDRESS, timeframe="7d", quote="USD")
+
+# Response served for each status code checked by the HTTP error tests
+_ERROR_RESPONSES = {
+    status_code: httpx.Response(status_code)
+    for status_code in (400, 401, 403, 404, 500)
+}
+
+# Error raised by the transport in the connection error test
+_CONN_ERR = httpx.RequestError("Connection failed")
+
+@pytest.fixture(scope="session")
 def sample_portfolio():
     return {
         "adaBalance": 10.0,
@@ -37,7 +54,7 @@ def sample_portfolio():
         "positionsNft": []
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_trades():
     return [
         {
@@ -52,127 +69,135 @@ def sample_trades():
         }
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_value_trended():
     return [
         {"time": 1692781200, "value": 57.0},
         {"time": 1692784800, "value": 60.2},
     ]
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def mock_transport():
+    """
+    Creates one httpx.AsyncClient per module whose requests are answered
+    in-process by an httpx.MockTransport. Requests are recorded and routed by
+    path to the entries of the responses dict; exception entries are raised
+    and a path with no entry fails the test.
+    """
+    responses = {}
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path not in responses:
+            pytest.fail(f"No mock response registered for {request.url.path}")
+        response = responses[request.url.path]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = httpx.AsyncClient(
+        base_url="http://test",
+        transport=httpx.MockTransport(handler)
+    )
+    yield client, responses, requests
+    await client.aclose()
+
 @pytest.fixture
-def mock_context():
-    mock_client = AsyncMock()
-    ctx = MagicMock()
-    ctx.request_context.lifespan_context = {"client": mock_client}
-    return ctx, mock_client
+def mock_http(mock_transport):
+    """
+    Returns the mock transport's per-path responses dict and the list of
+    recorded requests for one test. Both are cleared on teardown.
+    """
+    _, responses, requests = mock_transport
+    yield responses, requests
+    responses.clear()
+    requests.clear()
+
+@pytest.fixture(scope="module")
+def wallet_api(mock_transport):
+    client, _, _ = mock_transport
+    return WalletAPI(client)
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestWalletAPI:
-    async def test_get_wallet_portfolio_positions_success(self, mock_context, sample_portfolio):
+    async def test_get_wallet_portfolio_positions_success(self, wallet_api, mock_http, sample_portfolio):
         """Test get_wallet_portfolio_positions success."""
-        ctx, mock_client = mock_context
-        mock_client.get.return_value.status_code = 200
-        mock_client.get.return_value.json.return_value = sample_portfolio
+        responses, requests = mock_http
+        responses["/wallet/portfolio/positions"] = httpx.Response(200, json=sample_portfolio)
         
-        api = WalletAPI()
-        request = WalletPortfolioPositionsRequest(address="addr1xyz...")
-        result = await api.get_wallet_portfolio_positions(request, ctx)
+        result = await wallet_api.get_wallet_portfolio_positions(_REQ_PORTFOLIO)
         
         assert result.adaBalance == 10.0
         assert len(result.positionsFt) == 1
         assert result.positionsFt[0].ticker == "TEST1"
         
-        mock_client.get.assert_called_once_with(
+        assert [(r.url.path, dict(r.url.params)) for r in requests] == [(
             "/wallet/portfolio/positions",
-            params={"address": "addr1xyz..."}
-        )
+            {"address": _ADDRESS}
+        )]
 
-    async def test_get_wallet_trades_tokens_success(self, mock_context, sample_trades):
+    async def test_get_wallet_trades_tokens_success(self, wallet_api, mock_http, sample_trades):
         """Test get_wallet_trades_tokens success."""
-        ctx, mock_client = mock_context
-        mock_client.get.return_value.status_code = 200
-        mock_client.get.return_value.json.return_value = sample_trades
+        responses, requests = mock_http
+        responses["/wallet/trades/tokens"] = httpx.Response(200, json=sample_trades)
         
-        api = WalletAPI()
-        request = WalletTokenTradesRequest(address="addr1xyz...")
-        result = await api.get_wallet_trades_tokens(request, ctx)
+        result = await wallet_api.get_wallet_trades_tokens(_REQ_TRADES)
         
         assert len(result) == 1
         assert result[0].action == "Buy"
         assert result[0].tokenAAmount == 10.5
         
-        mock_client.get.assert_called_once_with(
+        assert [(r.url.path, dict(r.url.params)) for r in requests] == [(
             "/wallet/trades/tokens",
-            params={"address": "addr1xyz..."}
-        )
+            {"address": _ADDRESS, "page": "1", "perPage": "100"}
+        )]
 
-    async def test_get_wallet_value_trended_success(self, mock_context, sample_value_trended):
+    async def test_get_wallet_value_trended_success(self, wallet_api, mock_http, sample_value_trended):
         """Test get_wallet_value_trended success."""
-        ctx, mock_client = mock_context
-        mock_client.get.return_value.status_code = 200
-        mock_client.get.return_value.json.return_value = sample_value_trended
+        responses, requests = mock_http
+        responses["/wallet/value/trended"] = httpx.Response(200, json=sample_value_trended)
         
-        api = WalletAPI()
-        request = WalletValueTrendedRequest(
-            address="addr1xyz...",
-            timeframe="7d",
-            quote="USD"
-        )
-        result = await api.get_wallet_value_trended(request, ctx)
+        result = await wallet_api.get_wallet_value_trended(_REQ_VALUE_TRENDED)
         
         assert len(result) == 2
         assert result[0].value == 57.0
         assert result[1].time == 1692784800
         
-        mock_client.get.assert_called_once_with(
+        assert [(r.url.path, dict(r.url.params)) for r in requests] == [(
             "/wallet/value/trended",
-            params={
-                "address": "addr1xyz...",
+            {
+                "address": _ADDRESS,
                 "timeframe": "7d",
                 "quote": "USD"
             }
-        )
+        )]
 
-    async def test_http_status_errors(self, mock_context):
-        """Test various HTTP status error handling."""
-        ctx, mock_client = mock_context
-        
-        error_cases = [
-            (400, "Bad Request"),
-            (401, "Unauthorized"),
-            (403, "Forbidden"),
-            (404, "Not Found"),
-            (500, "Internal Server Error")
-        ]
+    @pytest.mark.parametrize("status_code", list(_ERROR_RESPONSES))
+    async def test_http_status_errors(self, wallet_api, mock_http, status_code):
+        """Test HTTP status error handling."""
+        responses, requests = mock_http
+        responses["/wallet/portfolio/positions"] = _ERROR_RESPONSES[status_code]
         
-        api = WalletAPI()
-        request = WalletPortfolioPositionsRequest(address="addr1xyz...")
+        with pytest.raises(TapToolsError) as exc_info:
+            await wallet_api.get_wallet_portfolio_positions(_REQ_PORTFOLIO)
+        assert exc_info.value.error_type == ErrorType.API
+
+    async def test_malformed_body(self, wallet_api, mock_http):
+        """Test a response body that is not valid JSON raises a parse error."""
+        responses, requests = mock_http
+        responses["/wallet/portfolio/positions"] = httpx.Response(200, content=b"{not json")
         
-        for status_code, error_msg in error_cases:
-            mock_client.get.return_value = AsyncMock(
-                status_code=status_code,
-                raise_for_status=AsyncMock(
-                    side_effect=httpx.HTTPStatusError(
-                        error_msg,
-                        request=httpx.Request("GET", "http://test"),
-                        response=httpx.Response(status_code)
-                    )
-                )
-            )
-            
-            with pytest.raises(TapToolsError) as exc_info:
-                await api.get_wallet_portfolio_positions(request, ctx)
-            assert exc_info.value.error_type == ErrorType.API
-
-    async def test_connection_error(self, mock_context):
+        with pytest.raises(TapToolsError, match="Failed to parse response") as exc_info:
+            await wallet_api.get_wallet_portfolio_positions(_REQ_PORTFOLIO)
+        assert exc_info.value.error_type == ErrorType.PARSE
+
+    async def test_connection_error(self, wallet_api, mock_http):
         """Test connection error handling."""
-        ctx, mock_client = mock_context
-        mock_client.get.side_effect = httpx.RequestError("Connection failed")
-        
-        api = WalletAPI()
-        request = WalletPortfolioPositionsRequest(address="addr1xyz...")
+        responses, requests = mock_http
+        responses["/wallet/portfolio/positions"] = _CONN_ERR
         
         with pytest.raises(TapToolsError) as exc_info:
-            await api.get_wallet_portfolio_positions(request, ctx)
+            await wallet_api.get_wallet_portfolio_positions(_REQ_PORTFOLIO)
         assert exc_info.value.error_type == ErrorType.CONNECTION
         assert str(exc_info.value.message) == "Connection failed"
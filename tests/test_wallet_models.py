@@ -10,6 +10,28 @@ from taptools_api_mcp.models.wallet import (
     WalletValueTrendedRequest, WalletValueTrend
 )
 
+# Valid payloads that the invalid-type tests vary one field at a time
+VALID_PORTFOLIO = {
+    "adaBalance": 10.0,
+    "adaValue": 10010.0,
+    "liquidValue": 10010.0,
+    "numFTs": 2,
+    "numNFTs": 1,
+    "positionsFt": [],
+    "positionsLp": [],
+    "positionsNft": []
+}
+VALID_TRADE = {
+    "action": "Buy",
+    "time": 1692781200,
+    "tokenA": "token1",
+    "tokenAName": "TEST1",
+    "tokenAAmount": 10.0,
+    "tokenB": "lovelace",
+    "tokenBName": "ADA",
+    "tokenBAmount": 5.0
+}
+
 class TestWalletPortfolioPositionsModels:
     def test_portfolio_positions_request_valid(self):
         """Test WalletPortfolioPositionsRequest with valid data."""
@@ -22,8 +44,9 @@ class TestWalletPortfolioPositionsModels:
         """Test WalletPortfolioPositionsRequest fails without required address."""
         with pytest.raises(ValidationError) as exc:
             WalletPortfolioPositionsRequest()
-        assert "field required" in str(exc.value)
-        assert "address" in str(exc.value)
+        msg = str(exc.value)
+        assert "field required" in msg
+        assert "address" in msg
 
     def test_portfolio_positions_response_valid(self):
         """Test WalletPortfolioPositionsResponse with valid data."""
@@ -55,22 +78,15 @@ class TestWalletPortfolioPositionsModels:
         assert len(response.positions_lp) == 2
         assert len(response.positions_nft) == 2
 
-    def test_portfolio_positions_response_invalid_types(self):
-        """Test WalletPortfolioPositionsResponse with invalid data types."""
-        with pytest.raises(ValidationError) as exc:
-            WalletPortfolioPositionsResponse(
-                ada_balance="invalid",  # Should be float
-                ada_value="invalid",    # Should be float
-                liquid_value="invalid", # Should be float
-                num_fts="invalid",      # Should be int
-                num_nfts="invalid",     # Should be int
-                positions_ft="invalid",  # Should be list
-                positions_lp="invalid",  # Should be list
-                positions_nft="invalid"  # Should be list
-            )
-        assert "value is not a valid float" in str(exc.value)
-        assert "value is not a valid integer" in str(exc.value)
-        assert "value is not a valid list" in str(exc.value)
+    @pytest.mark.parametrize("field,bad_value,expected", [
+        ("adaBalance", "invalid", "value is not a valid float"),
+        ("numFTs", "invalid", "value is not a valid integer"),
+        ("positionsFt", "invalid", "value is not a valid list"),
+    ])
+    def test_portfolio_positions_response_invalid_types(self, field, bad_value, expected):
+        """Test WalletPortfolioPositionsResponse rejects an invalid type for one field."""
+        with pytest.raises(ValidationError, match=rf"(?s){field}.*{expected}"):
+            WalletPortfolioPositionsResponse(**{**VALID_PORTFOLIO, field: bad_value})
 
 class TestWalletTokenTradesModels:
     def test_token_trades_request_valid(self):
@@ -86,8 +102,9 @@ class TestWalletTokenTradesModels:
         """Test WalletTokenTradesRequest fails without required address."""
         with pytest.raises(ValidationError) as exc:
             WalletTokenTradesRequest()
-        assert "field required" in str(exc.value)
-        assert "address" in str(exc.value)
+        msg = str(exc.value)
+        assert "field required" in msg
+        assert "address" in msg
 
     def test_token_trades_request_optional_unit(self):
         """Test WalletTokenTradesRequest with optional unit omitted."""
@@ -118,22 +135,15 @@ class TestWalletTokenTradesModels:
         assert trade.token_b_amount == 200.5
         assert trade.token_b_name == "Token Two"
 
-    def test_wallet_token_trade_invalid_types(self):
-        """Test WalletTokenTrade with invalid data types."""
-        with pytest.raises(ValidationError) as exc:
-            WalletTokenTrade(
-                action=123,           # Should be string
-                hash=123,             # Should be string
-                time="invalid",       # Should be integer
-                token_a=123,          # Should be string
-                token_a_amount="invalid",  # Should be float
-                token_a_name=123,     # Should be string
-                token_b=123,          # Should be string
-                token_b_amount="invalid",  # Should be float
-                token_b_name=123      # Should be string
-            )
-        assert "value is not a valid integer" in str(exc.value)
-        assert "value is not a valid float" in str(exc.value)
+    @pytest.mark.parametrize("field,bad_value,expected", [
+        ("time", "invalid", "value is not a valid integer"),
+        ("tokenAAmount", "invalid", "value is not a valid float"),
+        ("tokenBAmount", "invalid", "value is not a valid float"),
+    ])
+    def test_wallet_token_trade_invalid_types(self, field, bad_value, expected):
+        """Test WalletTokenTrade rejects an invalid type for one field."""
+        with pytest.raises(ValidationError, match=rf"(?s){field}.*{expected}"):
+            WalletTokenTrade(**{**VALID_TRADE, field: bad_value})
 
 class TestWalletValueTrendedModels:
     def test_value_trended_request_valid(self):
@@ -160,8 +170,9 @@ class TestWalletValueTrendedModels:
         """Test WalletValueTrendedRequest fails without required address."""
         with pytest.raises(ValidationError) as exc:
             WalletValueTrendedRequest()
-        assert "field required" in str(exc.value)
-        assert "address" in str(exc.value)
+        msg = str(exc.value)
+        assert "field required" in msg
+        assert "address" in msg
 
     def test_wallet_value_trend_valid(self):
         """Test WalletValueTrend with valid data."""
@@ -179,8 +190,9 @@ class TestWalletValueTrendedModels:
                 time="invalid",  # Should be integer
                 value="invalid"  # Should be float
             )
-        assert "value is not a valid integer" in str(exc.value)
-        assert "value is not a valid float" in str(exc.value)
+        msg = str(exc.value)
+        assert "value is not a valid integer" in msg
+        assert "value is not a valid float" in msg
 
     def test_wallet_value_trend_missing_required(self):
         """Test WalletValueTrend fails without required fields."""